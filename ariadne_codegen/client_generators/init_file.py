@@ -8,6 +8,7 @@ from ..plugins.manager import PluginManager
 class InitFileGenerator:
     def __init__(self, plugin_manager: Optional[PluginManager] = None) -> None:
         self.imports: list = []
+        self._names: List[str] = []
         self.plugin_manager = plugin_manager
 
     def add_import(self, names: List[str], from_: str, level: int = 0) -> None:
@@ -18,16 +19,13 @@ class InitFileGenerator:
         if self.plugin_manager:
             import_ = self.plugin_manager.generate_init_import(import_)
         self.imports.append(import_)
+        self._names.extend(alias.name for alias in import_.names)
 
     def generate(self) -> ast.Module:
         """Generate init with imports and public api of package."""
-        module = ast.Module(body=self.imports, type_ignores=[])
+        module = ast.Module(body=list(self.imports), type_ignores=[])
         if self.imports:
-            constants_names: List[str] = []
-            for import_ in self.imports:
-                constants_names.extend([n.name for n in import_.names])
-            constants_names.sort()
-
+            constants_names = sorted(self._names)
             module.body.append(
                 ast.Assign(
                     targets=[
@@ -35,9 +33,7 @@ class InitFileGenerator:
                             id="__all__",
                         )
                     ],
-                    value=ast.List(
-                        elts=[ast.Constant(value=n) for n in constants_names]
-                    ),
+                    value=ast.List(elts=list(map(ast.Constant, constants_names))),
                     lineno=len(self.imports) + 1,
                 )
             )
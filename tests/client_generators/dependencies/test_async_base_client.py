@@ -18,6 +18,11 @@ from ariadne_codegen.client_generators.dependencies.exceptions import (
 from ...utils import decode_multipart_request
 
 
+@pytest.fixture(scope="module")
+def client():
+    return AsyncBaseClient(url="http://base_url")
+
+
 @pytest.mark.asyncio
 async def test_execute_sends_post_to_correct_url_with_correct_payload(httpx_mock):
     httpx_mock.add_response()
@@ -44,7 +49,7 @@ async def test_execute_sends_post_to_correct_url_with_correct_payload(httpx_mock
 
 
 @pytest.mark.asyncio
-async def test_execute_parses_pydantic_variables_before_sending(httpx_mock):
+async def test_execute_parses_pydantic_variables_before_sending(client, httpx_mock):
     class TestModel1(BaseModel):
         a: int
 
@@ -52,7 +57,6 @@ async def test_execute_parses_pydantic_variables_before_sending(httpx_mock):
         nested: TestModel1
 
     httpx_mock.add_response()
-    client = AsyncBaseClient(url="http://base_url")
     query_str = """
     query Abc($v1: TestModel1!, $v2: TestModel2) {
         abc(v1: $v1, v2: $v2){
@@ -77,12 +81,11 @@ async def test_execute_parses_pydantic_variables_before_sending(httpx_mock):
 
 
 @pytest.mark.asyncio
-async def test_execute_correctly_parses_top_level_list_variables(httpx_mock):
+async def test_execute_correctly_parses_top_level_list_variables(client, httpx_mock):
     class TestModel1(BaseModel):
         a: int
 
     httpx_mock.add_response()
-    client = AsyncBaseClient(url="http://base_url")
     query_str = """
     query Abc($v1: [[TestModel1!]!]!) {
         abc(v1: $v1){
@@ -110,9 +113,8 @@ async def test_execute_correctly_parses_top_level_list_variables(httpx_mock):
 
 
 @pytest.mark.asyncio
-async def test_execute_sends_payload_without_unset_arguments(httpx_mock):
+async def test_execute_sends_payload_without_unset_arguments(client, httpx_mock):
     httpx_mock.add_response()
-    client = AsyncBaseClient(url="http://base_url")
     query_str = """
     query Abc($arg1: TestInputA, $arg2: String, $arg3: Float, $arg4: Int!) {
         abc(arg1: $arg1, arg2: $arg2, arg3: $arg3, arg4: $arg4){
@@ -135,7 +137,7 @@ async def test_execute_sends_payload_without_unset_arguments(httpx_mock):
 
 
 @pytest.mark.asyncio
-async def test_execute_sends_payload_without_unset_input_fields(httpx_mock):
+async def test_execute_sends_payload_without_unset_input_fields(client, httpx_mock):
     class TestInputB(BaseModel):
         required_b: str
         optional_b: Optional[str] = None
@@ -148,7 +150,6 @@ async def test_execute_sends_payload_without_unset_input_fields(httpx_mock):
         input_b3: Optional[TestInputB] = None
 
     httpx_mock.add_response()
-    client = AsyncBaseClient(url="http://base_url")
     query_str = """
     query Abc($arg: TestInputB) {
         abc(arg: $arg){
@@ -184,10 +185,10 @@ async def test_execute_sends_payload_without_unset_input_fields(httpx_mock):
 
 @pytest.mark.asyncio
 async def test_execute_sends_payload_with_serialized_datetime_without_exception(
+    client,
     httpx_mock,
 ):
     httpx_mock.add_response()
-    client = AsyncBaseClient(url="http://base_url")
     query_str = "query Abc($arg: DATETIME) { abc }"
     arg_value = datetime(2023, 12, 31, 10, 15)
 
@@ -199,9 +200,8 @@ async def test_execute_sends_payload_with_serialized_datetime_without_exception(
 
 
 @pytest.mark.asyncio
-async def test_execute_sends_request_with_correct_content_type(httpx_mock):
+async def test_execute_sends_request_with_correct_content_type(client, httpx_mock):
     httpx_mock.add_response()
-    client = AsyncBaseClient(url="http://base_url")
 
     await client.execute("query Abc { abc }")
 
@@ -262,11 +262,10 @@ async def test_execute_sends_json_request_with_headers_from_passed_kwargs(httpx_
 
 @pytest.mark.asyncio
 async def test_execute_sends_file_with_multipart_form_data_content_type(
-    httpx_mock, txt_file
+    client, httpx_mock, txt_file
 ):
     httpx_mock.add_response()
 
-    client = AsyncBaseClient(url="http://base_url")
     await client.execute(
         "query Abc($file: Upload!) { abc(file: $file) }", "Abc", {"file": txt_file}
     )
@@ -276,11 +275,10 @@ async def test_execute_sends_file_with_multipart_form_data_content_type(
 
 
 @pytest.mark.asyncio
-async def test_execute_sends_file_as_multipart_request(httpx_mock, txt_file):
+async def test_execute_sends_file_as_multipart_request(client, httpx_mock, txt_file):
     httpx_mock.add_response()
     query_str = "query Abc($file: Upload!) { abc(file: $file) }"
 
-    client = AsyncBaseClient(url="http://base_url")
     await client.execute(query_str, "Abc", {"file": txt_file})
 
     request = httpx_mock.get_request()
@@ -307,11 +305,10 @@ async def test_execute_sends_file_as_multipart_request(httpx_mock, txt_file):
 
 
 @pytest.mark.asyncio
-async def test_execute_sends_file_from_memory(httpx_mock, in_memory_txt_file):
+async def test_execute_sends_file_from_memory(client, httpx_mock, in_memory_txt_file):
     httpx_mock.add_response()
     query_str = "query Abc($file: Upload!) { abc(file: $file) }"
 
-    client = AsyncBaseClient(url="http://base_url")
     await client.execute(query_str, "Abc", {"file": in_memory_txt_file})
 
     request = httpx_mock.get_request()
@@ -338,11 +335,10 @@ async def test_execute_sends_file_from_memory(httpx_mock, in_memory_txt_file):
 
 
 @pytest.mark.asyncio
-async def test_execute_sends_multiple_files(httpx_mock, txt_file, png_file):
+async def test_execute_sends_multiple_files(client, httpx_mock, txt_file, png_file):
     httpx_mock.add_response()
     query_str = "query Abc($files: [Upload!]!) { abc(files: $files) }"
 
-    client = AsyncBaseClient(url="http://base_url")
     await client.execute(query_str, "Abc", {"files": [txt_file, png_file]})
 
     request = httpx_mock.get_request()
@@ -374,14 +370,13 @@ async def test_execute_sends_multiple_files(httpx_mock, txt_file, png_file):
 
 
 @pytest.mark.asyncio
-async def test_execute_sends_nested_file(httpx_mock, txt_file):
+async def test_execute_sends_nested_file(client, httpx_mock, txt_file):
     class InputType(BaseModel):
         file_: Any
 
     httpx_mock.add_response()
     query_str = "query Abc($input: InputType!) { abc(input: $input) }"
 
-    client = AsyncBaseClient(url="http://base_url")
     await client.execute(query_str, "Abc", {"input": InputType(file_=txt_file)})
 
     request = httpx_mock.get_request()
@@ -408,11 +403,10 @@ async def test_execute_sends_nested_file(httpx_mock, txt_file):
 
 
 @pytest.mark.asyncio
-async def test_execute_sends_each_file_only_once(httpx_mock, txt_file):
+async def test_execute_sends_each_file_only_once(client, httpx_mock, txt_file):
     httpx_mock.add_response()
     query_str = "query Abc($files: [Upload!]!) { abc(files: $files) }"
 
-    client = AsyncBaseClient(url="http://base_url")
     await client.execute(query_str, "Abc", {"files": [txt_file, txt_file]})
 
     request = httpx_mock.get_request()
@@ -493,9 +487,8 @@ async def test_execute_sends_multipart_request_with_headers_from_passed_kwargs(
     ],
 )
 def test_get_data_raises_graphql_client_http_error(
-    mocker, status_code, response_content
+    client, status_code, response_content
 ):
-    client = AsyncBaseClient(url="base_url", http_client=mocker.MagicMock())
     response = httpx.Response(
         status_code=status_code, content=json.dumps(response_content)
     )
@@ -508,9 +501,8 @@ def test_get_data_raises_graphql_client_http_error(
 
 @pytest.mark.parametrize("response_content", ["invalid_json", {"not_data": ""}, ""])
 def test_get_data_raises_graphql_client_invalid_response_error(
-    mocker, response_content
+    client, response_content
 ):
-    client = AsyncBaseClient(url="base_url", http_client=mocker.MagicMock())
     response = httpx.Response(status_code=200, content=json.dumps(response_content))
 
     with pytest.raises(GraphQLClientInvalidResponseError) as exc:
@@ -553,9 +545,7 @@ def test_get_data_raises_graphql_client_invalid_response_error(
         },
     ],
 )
-def test_get_data_raises_graphql_client_graphql_multi_error(mocker, response_content):
-    client = AsyncBaseClient(url="base_url", http_client=mocker.MagicMock())
-
+def test_get_data_raises_graphql_client_graphql_multi_error(client, response_content):
     with pytest.raises(GraphQLClientGraphQLMultiError):
         client.get_data(
             httpx.Response(status_code=200, content=json.dumps(response_content))
@@ -566,9 +556,7 @@ def test_get_data_raises_graphql_client_graphql_multi_error(mocker, response_con
     "response_content",
     [{"errors": [], "data": {}}, {"errors": None, "data": {}}, {"data": {}}],
 )
-def test_get_data_doesnt_raise_exception(mocker, response_content):
-    client = AsyncBaseClient(url="base_url", http_client=mocker.MagicMock())
-
+def test_get_data_doesnt_raise_exception(client, response_content):
     data = client.get_data(
         httpx.Response(status_code=200, content=json.dumps(response_content))
     )
@@ -71,3 +71,19 @@ def test_generate_triggers_generate_init_module_from_plugin_manager(
     generator.generate()
 
     assert mocked_plugin_manager.generate_init_module.called
+
+
+def test_generate_called_multiple_times_returns_the_same_module():
+    generator = InitFileGenerator()
+    generator.add_import(["Xyz"], "xyz", 1)
+    generator.add_import(["Abcd", "Efgh"], "abcd", 1)
+
+    first_module = generator.generate()
+    second_module = generator.generate()
+
+    assert len(generator.imports) == 2
+    assert ast.dump(first_module) == ast.dump(second_module)
+    assign_stmt = second_module.body[2]
+    assert isinstance(assign_stmt, ast.Assign)
+    assert isinstance(assign_stmt.value, ast.List)
+    assert [c.value for c in assign_stmt.value.elts] == ["Abcd", "Efgh", "Xyz"]